@@ -22,6 +22,12 @@ if os.environ.get('BUILD_WHEEL_WITH_EXTENSION'):
         ),
     ]
 
+if os.environ.get('BUILD_CYTHON_EXTENSION'):
+    from Cython.Build import cythonize
+    ext_modules += cythonize([
+        Extension("snap7._common_fast", ["snap7/_common_fast.pyx"]),
+    ])
+
 
 def read(fname):
     return open(os.path.join(os.path.dirname(__file__), fname)).read()
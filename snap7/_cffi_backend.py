@@ -0,0 +1,48 @@
+"""
+Optional cffi (ABI mode) binding for the snap7 error-text entry points.
+
+ctypes allocates short-lived conversion objects on every foreign call;
+the cffi equivalents create far less GC pressure and JIT to near-native
+calls on PyPy. Only the error-text surface is bound here: the rest of
+the API passes ctypes objects around, which cffi functions cannot
+accept. ABI mode (`dlopen`) needs no compilation step, so importing
+this module only requires the cffi package itself.
+"""
+from typing import Callable, Dict
+
+import cffi
+
+ffi = cffi.FFI()
+ffi.cdef("""
+    int Cli_ErrorText(int error, char *text, int text_len);
+    int Srv_ErrorText(int error, char *text, int text_len);
+    int Par_ErrorText(int error, char *text, int text_len);
+""")
+
+
+def _wrap(func: Callable) -> Callable:
+    """Adapts a cffi function to the calling convention of error_text(),
+    which passes a writable ctypes char array as the text argument.
+    """
+    def call(error, text, len_):
+        return func(error, ffi.from_buffer(text, require_writable=True), len_)
+    return call
+
+
+def error_text_funcs(lib_location: str) -> Dict[str, Callable]:
+    """Returns the context -> error-text function table for the snap7
+    library at `lib_location`, loaded in cffi ABI mode.
+
+    Args:
+        lib_location: full path to the snap7 shared library.
+
+    Returns:
+        Mapping with the same shape and call signatures as the ctypes
+        table built by `snap7.common.load_library`.
+    """
+    lib = ffi.dlopen(lib_location)
+    return {
+        "client": _wrap(lib.Cli_ErrorText),
+        "server": _wrap(lib.Srv_ErrorText),
+        "partner": _wrap(lib.Par_ErrorText),
+    }
@@ -0,0 +1,36 @@
+# cython: language_level=3
+"""
+Optional compiled fast path for the hot pure-Python helpers in
+`snap7.common`. Built only when the `BUILD_CYTHON_EXTENSION`
+environment variable is set at install time; `snap7.common` falls back
+to the pure-Python implementations when this module is absent.
+"""
+
+
+def is_valid_ipv4(str address):
+    """Checks if an ipv4 address is valid.
+
+    Compiled twin of `snap7.common.is_valid_ipv4`: the octet arithmetic
+    runs on C integers instead of boxed Python ints.
+    """
+    cdef bytes raw, part, digits
+    cdef Py_ssize_t length
+    cdef int value
+    try:
+        raw = address.encode("ascii")
+    except UnicodeError:
+        return False
+    parts = raw.split(b".")
+    if len(parts) != 4:
+        return False
+    for part in parts:
+        length = len(part)
+        if not part.isdigit() or length > 3:
+            return False
+        if part[0] == 0x30 and length > 1:  # no leading zeros
+            return False
+        digits = part.rjust(3, b"0")
+        value = (digits[0] - 48) * 100 + (digits[1] - 48) * 10 + (digits[2] - 48)
+        if value > 255:
+            return False
+    return True
@@ -2,14 +2,13 @@
 Snap7 client used for connection to a siemens 7 server.
 """
 import logging
-import re
 from ctypes import c_int, c_char_p, byref, sizeof, c_uint16, c_int32, c_byte, c_ulong, Array
 from ctypes import c_void_p, create_string_buffer
 from datetime import datetime
 from typing import Union, Tuple, Optional, List
 
 import snap7
-from snap7.common import check_error, load_library, ipv4
+from snap7.common import check_error_client, load_library, is_valid_ipv4
 from snap7.exceptions import Snap7Exception
 from snap7.types import Areas, WordLen, S7Object, buffer_type, buffer_size, BlocksList, S7CpuInfo, S7DataItem, S7SZL, S7OrderCode, \
     S7Protection, S7SZLList, S7CpInfo
@@ -21,9 +20,13 @@ logger = logging.getLogger(__name__)
 def error_wrap(func):
     """Parses a s7 error code returned the decorated function."""
 
-    def f(*args, **kw):
-        code = func(*args, **kw)
-        check_error(code, context="client")
+    # func and check_error are bound as argument defaults: loading them
+    # costs a local fetch instead of a cell or global lookup, and the
+    # non-error fast path is a single inlined compare with no extra call.
+    def f(*args, _func=func, _check=check_error_client, **kw):
+        code = _func(*args, **kw)
+        if code < 0 or code > 1:
+            _check(code, args[0]._library)
 
     return f
 
@@ -158,7 +161,7 @@ class Client:
         """
         info = snap7.types.S7CpuInfo()
         result = self._library.Cli_GetCpuInfo(self._pointer, byref(info))
-        check_error(result, context="client")
+        check_error_client(result, library=self._library)
         return info
 
     @error_wrap
@@ -225,7 +228,7 @@ class Client:
         result = (self._library.Cli_DBRead(
             self._pointer, db_number, start, size,
             byref(data)))
-        check_error(result, context="client")
+        check_error_client(result, library=self._library)
         return bytearray(data)
 
     @error_wrap
@@ -288,7 +291,7 @@ class Client:
         result = self._library.Cli_FullUpload(self._pointer, block_type,
                                               block_num, byref(_buffer),
                                               byref(size))
-        check_error(result, context="client")
+        check_error_client(result, library=self._library)
         return bytearray(_buffer)[:size.value], size.value
 
     def upload(self, block_num: int) -> bytearray:
@@ -311,7 +314,7 @@ class Client:
         result = self._library.Cli_Upload(self._pointer, block_type, block_num,
                                           byref(_buffer), byref(size))
 
-        check_error(result, context="client")
+        check_error_client(result, library=self._library)
         logger.info(f'received {size} bytes')
         return bytearray(_buffer)
 
@@ -362,7 +365,7 @@ class Client:
         result = self._library.Cli_DBGet(
             self._pointer, db_number, byref(_buffer),
             byref(c_int(buffer_size)))
-        check_error(result, context="client")
+        check_error_client(result, library=self._library)
         return bytearray(_buffer)
 
     def read_area(self, area: Areas, dbnumber: int, start: int, size: int) -> bytearray:
@@ -402,7 +405,7 @@ class Client:
         data = (type_ * size)()
         result = self._library.Cli_ReadArea(self._pointer, area.value, dbnumber, start,
                                             size, wordlen.value, byref(data))
-        check_error(result, context="client")
+        check_error_client(result, library=self._library)
         return bytearray(data)
 
     @error_wrap
@@ -450,7 +453,7 @@ class Client:
         """
         result = self._library.Cli_ReadMultiVars(self._pointer, byref(items),
                                                  c_int32(len(items)))
-        check_error(result, context="client")
+        check_error_client(result, library=self._library)
         return result, items
 
     def list_blocks(self) -> BlocksList:
@@ -467,7 +470,7 @@ class Client:
         logger.debug("listing blocks")
         blocksList = BlocksList()
         result = self._library.Cli_ListBlocks(self._pointer, byref(blocksList))
-        check_error(result, context="client")
+        check_error_client(result, library=self._library)
         logger.debug(f"blocks: {blocksList}")
         return blocksList
 
@@ -503,7 +506,7 @@ class Client:
 
         logger.debug(f"number of items found: {count}")
 
-        check_error(result, context="client")
+        check_error_client(result, library=self._library)
         return data
 
     def get_block_info(self, blocktype: str, db_number: int) -> TS7BlockInfo:
@@ -547,7 +550,7 @@ class Client:
         data = TS7BlockInfo()
 
         result = self._library.Cli_GetAgBlockInfo(self._pointer, blocktype_, db_number, byref(data))
-        check_error(result, context="client")
+        check_error_client(result, library=self._library)
         return data
 
     @error_wrap
@@ -593,7 +596,7 @@ class Client:
             :obj:`Snap7Exception`: if the result of setting the connection params is
                 different than 0.
         """
-        if not re.match(ipv4, address):
+        if not is_valid_ipv4(address):
             raise ValueError(f"{address} is invalid ipv4")
         result = self._library.Cli_SetConnectionParams(self._pointer, address,
                                                        c_uint16(local_tsap),
@@ -627,7 +630,7 @@ class Client:
         """
         connected = c_int32()
         result = self._library.Cli_GetConnected(self._pointer, byref(connected))
-        check_error(result, context="client")
+        check_error_client(result, library=self._library)
         return bool(connected)
 
     def ab_read(self, start: int, size: int) -> bytearray:
@@ -646,7 +649,7 @@ class Client:
         logger.debug(f"ab_read: start: {start}: size {size}: ")
         result = self._library.Cli_ABRead(self._pointer, start, size,
                                           byref(data))
-        check_error(result, context="client")
+        check_error_client(result, library=self._library)
         return bytearray(data)
 
     def ab_write(self, start: int, data: bytearray) -> int:
@@ -681,7 +684,7 @@ class Client:
         logger.debug(f"ab_read: start: {start}: size {size}: ")
         result = self._library.Cli_AsABRead(self._pointer, start, size,
                                             byref(data))
-        check_error(result, context="client")
+        check_error_client(result, library=self._library)
         return result
 
     def as_ab_write(self, start: int, data: bytearray) -> int:
@@ -701,7 +704,7 @@ class Client:
         logger.debug(f"ab write: start: {start}: size: {size}: ")
         result = self._library.Cli_AsABWrite(
             self._pointer, start, size, byref(cdata))
-        check_error(result, context="client")
+        check_error_client(result, library=self._library)
         return result
 
     def as_compress(self, time: int) -> int:
@@ -714,7 +717,7 @@ class Client:
             Snap7 code.
         """
         result = self._library.Cli_AsCompress(self._pointer, time)
-        check_error(result, context="client")
+        check_error_client(result, library=self._library)
         return result
 
     def as_copy_ram_to_rom(self, timeout: int = 1) -> int:
@@ -727,7 +730,7 @@ class Client:
             Snap7 code.
         """
         result = self._library.Cli_AsCopyRamToRom(self._pointer, timeout)
-        check_error(result, context="client")
+        check_error_client(result, library=self._library)
         return result
 
     def as_ct_read(self, start: int, amount: int, data) -> int:
@@ -742,7 +745,7 @@ class Client:
             Snap7 code.
         """
         result = self._library.Cli_AsCTRead(self._pointer, start, amount, byref(data))
-        check_error(result, context="client")
+        check_error_client(result, library=self._library)
         return result
 
     def as_ct_write(self, start: int, amount: int, data: bytearray) -> int:
@@ -759,7 +762,7 @@ class Client:
         type_ = snap7.types.wordlen_to_ctypes[WordLen.Counter.value]
         cdata = (type_ * amount).from_buffer_copy(data)
         result = self._library.Cli_AsCTWrite(self._pointer, start, amount, byref(cdata))
-        check_error(result, context="client")
+        check_error_client(result, library=self._library)
         return result
 
     def as_db_fill(self, db_number: int, filler) -> int:
@@ -773,7 +776,7 @@ class Client:
             Snap7 code.
         """
         result = self._library.Cli_AsDBFill(self._pointer, db_number, filler)
-        check_error(result, context="client")
+        check_error_client(result, library=self._library)
         return result
 
     def as_db_get(self, db_number: int, _buffer, size) -> bytearray:
@@ -791,7 +794,7 @@ class Client:
             Snap7 code.
         """
         result = self._library.Cli_AsDBGet(self._pointer, db_number, byref(_buffer), byref(size))
-        check_error(result, context="client")
+        check_error_client(result, library=self._library)
         return result
 
     def as_db_read(self, db_number: int, start: int, size: int, data) -> Array:
@@ -814,7 +817,7 @@ class Client:
             0
         """
         result = self._library.Cli_AsDBRead(self._pointer, db_number, start, size, byref(data))
-        check_error(result, context="client")
+        check_error_client(result, library=self._library)
         return result
 
     def as_db_write(self, db_number: int, start: int, size: int, data) -> int:
@@ -830,7 +833,7 @@ class Client:
             Snap7 code.
         """
         result = self._library.Cli_AsDBWrite(self._pointer, db_number, start, size, byref(data))
-        check_error(result, context="client")
+        check_error_client(result, library=self._library)
         return result
 
     def as_download(self, data: bytearray, block_num: int) -> int:
@@ -850,7 +853,7 @@ class Client:
         type_ = c_byte * len(data)
         cdata = type_.from_buffer_copy(data)
         result = self._library.Cli_AsDownload(self._pointer, block_num, byref(cdata), size)
-        check_error(result)
+        check_error_client(result, library=self._library)
         return result
 
     @error_wrap
@@ -893,7 +896,7 @@ class Client:
         type_ = param_types[number]
         value = type_()
         code = self._library.Cli_GetParam(self._pointer, c_int(number), byref(value))
-        check_error(code)
+        check_error_client(code, library=self._library)
         return value.value
 
     def get_pdu_length(self) -> int:
@@ -910,7 +913,7 @@ class Client:
         requested_ = c_uint16()
         negotiated_ = c_uint16()
         code = self._library.Cli_GetPduLength(self._pointer, byref(requested_), byref(negotiated_))
-        check_error(code)
+        check_error_client(code, library=self._library)
         return negotiated_.value
 
     def get_plc_datetime(self) -> datetime:
@@ -926,7 +929,7 @@ class Client:
         type_ = c_int32
         buffer = (type_ * 9)()
         result = self._library.Cli_GetPlcDateTime(self._pointer, byref(buffer))
-        check_error(result, context="client")
+        check_error_client(result, library=self._library)
 
         return datetime(
             year=buffer[5] + 1900,
@@ -968,13 +971,13 @@ class Client:
             Snap7 code. If 0 - Job is done successfully. If 1 - Job is either pending or contains s7errors
         """
         result = self._library.Cli_CheckAsCompletion(self._pointer, p_value)
-        check_error(result, context="client")
+        check_error_client(result, library=self._library)
         return result
 
     def set_as_callback(self, pfn_clicompletion, p_usr):
         # Cli_SetAsCallback
         result = self._library.Cli_SetAsCallback(self._pointer, pfn_clicompletion, p_usr)
-        check_error(result, context='client')
+        check_error_client(result, library=self._library)
         return result
 
     def wait_as_completion(self, timeout: int) -> int:
@@ -988,7 +991,7 @@ class Client:
         """
         # Cli_WaitAsCompletion
         result = self._library.Cli_WaitAsCompletion(self._pointer, c_ulong(timeout))
-        check_error(result, context="client")
+        check_error_client(result, library=self._library)
         return result
 
     def _prepare_as_read_area(self, area: Areas, size: int) -> Tuple[WordLen, Array]:
@@ -1021,7 +1024,7 @@ class Client:
         """
         logger.debug(f"reading area: {area.name} dbnumber: {dbnumber} start: {start}: amount {size}: wordlen: {wordlen.name}={wordlen.value}")
         result = self._library.Cli_AsReadArea(self._pointer, area.value, dbnumber, start, size, wordlen.value, pusrdata)
-        check_error(result, context="client")
+        check_error_client(result, library=self._library)
         return result
 
     def _prepare_as_write_area(self, area: Areas, data: bytearray) -> Tuple[WordLen, Array]:
@@ -1056,7 +1059,7 @@ class Client:
                      f"wordlen {wordlen} type: {type_}")
         cdata = (type_ * len(pusrdata)).from_buffer_copy(pusrdata)
         res = self._library.Cli_AsWriteArea(self._pointer, area.value, dbnumber, start, size, wordlen.value, byref(cdata))
-        check_error(res, context="client")
+        check_error_client(res, library=self._library)
         return res
 
     def as_eb_read(self, start: int, size: int, data) -> int:
@@ -1071,7 +1074,7 @@ class Client:
             Snap7 code.
         """
         result = self._library.Cli_AsEBRead(self._pointer, start, size, byref(data))
-        check_error(result, context="client")
+        check_error_client(result, library=self._library)
         return result
 
     def as_eb_write(self, start: int, size: int, data: bytearray) -> int:
@@ -1088,7 +1091,7 @@ class Client:
         type_ = snap7.types.wordlen_to_ctypes[WordLen.Byte.value]
         cdata = (type_ * size).from_buffer_copy(data)
         result = self._library.Cli_AsEBWrite(self._pointer, start, size, byref(cdata))
-        check_error(result, context="client")
+        check_error_client(result, library=self._library)
         return result
 
     def as_full_upload(self, _type: str, block_num: int) -> int:
@@ -1108,7 +1111,7 @@ class Client:
         size = c_int(sizeof(_buffer))
         block_type = snap7.types.block_types[_type]
         result = self._library.Cli_AsFullUpload(self._pointer, block_type, block_num, byref(_buffer), byref(size))
-        check_error(result, context="client")
+        check_error_client(result, library=self._library)
         return result
 
     def as_list_blocks_of_type(self, blocktype: str, data, count) -> int:
@@ -1129,7 +1132,7 @@ class Client:
         if not _blocktype:
             raise Snap7Exception("The blocktype parameter was invalid")
         result = self._library.Cli_AsListBlocksOfType(self._pointer, _blocktype, byref(data), byref(count))
-        check_error(result, context="client")
+        check_error_client(result, library=self._library)
         return result
 
     def as_mb_read(self, start: int, size: int, data) -> int:
@@ -1144,7 +1147,7 @@ class Client:
             Snap7 code.
         """
         result = self._library.Cli_AsMBRead(self._pointer, start, size, byref(data))
-        check_error(result, context="client")
+        check_error_client(result, library=self._library)
         return result
 
     def as_mb_write(self, start: int, size: int, data: bytearray) -> int:
@@ -1161,7 +1164,7 @@ class Client:
         type_ = snap7.types.wordlen_to_ctypes[WordLen.Byte.value]
         cdata = (type_ * size).from_buffer_copy(data)
         result = self._library.Cli_AsMBWrite(self._pointer, start, size, byref(cdata))
-        check_error(result, context="client")
+        check_error_client(result, library=self._library)
         return result
 
     def as_read_szl(self, ssl_id: int, index: int, s7_szl: S7SZL, size) -> int:
@@ -1177,7 +1180,7 @@ class Client:
             Snap7 code.
         """
         result = self._library.Cli_AsReadSZL(self._pointer, ssl_id, index, byref(s7_szl), byref(size))
-        check_error(result, context="client")
+        check_error_client(result, library=self._library)
         return result
 
     def as_read_szl_list(self, szl_list, items_count) -> int:
@@ -1191,7 +1194,7 @@ class Client:
             Snap7 code.
         """
         result = self._library.Cli_AsReadSZLList(self._pointer, byref(szl_list), byref(items_count))
-        check_error(result, context="client")
+        check_error_client(result, library=self._library)
         return result
 
     def as_tm_read(self, start: int, amount: int, data) -> bytearray:
@@ -1206,7 +1209,7 @@ class Client:
             Snap7 code.
         """
         result = self._library.Cli_AsTMRead(self._pointer, start, amount, byref(data))
-        check_error(result, context="client")
+        check_error_client(result, library=self._library)
         return result
 
     def as_tm_write(self, start: int, amount: int, data: bytearray) -> int:
@@ -1223,7 +1226,7 @@ class Client:
         type_ = snap7.types.wordlen_to_ctypes[WordLen.Timer.value]
         cdata = (type_ * amount).from_buffer_copy(data)
         result = self._library.Cli_AsTMWrite(self._pointer, start, amount, byref(cdata))
-        check_error(result)
+        check_error_client(result, library=self._library)
         return result
 
     def as_upload(self, block_num: int, _buffer, size) -> int:
@@ -1242,7 +1245,7 @@ class Client:
         """
         block_type = snap7.types.block_types['DB']
         result = self._library.Cli_AsUpload(self._pointer, block_type, block_num, byref(_buffer), byref(size))
-        check_error(result, context="client")
+        check_error_client(result, library=self._library)
         return result
 
     def copy_ram_to_rom(self, timeout: int = 1) -> int:
@@ -1255,7 +1258,7 @@ class Client:
             Snap7 code.
         """
         result = self._library.Cli_CopyRamToRom(self._pointer, timeout)
-        check_error(result, context="client")
+        check_error_client(result, library=self._library)
         return result
 
     def ct_read(self, start: int, amount: int) -> bytearray:
@@ -1271,7 +1274,7 @@ class Client:
         type_ = snap7.types.wordlen_to_ctypes[WordLen.Counter.value]
         data = (type_ * amount)()
         result = self._library.Cli_CTRead(self._pointer, start, amount, byref(data))
-        check_error(result, context="client")
+        check_error_client(result, library=self._library)
         return bytearray(data)
 
     def ct_write(self, start: int, amount: int, data: bytearray) -> int:
@@ -1288,7 +1291,7 @@ class Client:
         type_ = snap7.types.wordlen_to_ctypes[WordLen.Counter.value]
         cdata = (type_ * amount).from_buffer_copy(data)
         result = self._library.Cli_CTWrite(self._pointer, start, amount, byref(cdata))
-        check_error(result)
+        check_error_client(result, library=self._library)
         return result
 
     def db_fill(self, db_number: int, filler: int) -> int:
@@ -1302,7 +1305,7 @@ class Client:
             Snap7 code.
         """
         result = self._library.Cli_DBFill(self._pointer, db_number, filler)
-        check_error(result)
+        check_error_client(result, library=self._library)
         return result
 
     def eb_read(self, start: int, size: int) -> bytearray:
@@ -1318,7 +1321,7 @@ class Client:
         type_ = snap7.types.wordlen_to_ctypes[WordLen.Byte.value]
         data = (type_ * size)()
         result = self._library.Cli_EBRead(self._pointer, start, size, byref(data))
-        check_error(result, context="client")
+        check_error_client(result, library=self._library)
         return bytearray(data)
 
     def eb_write(self, start: int, size: int, data: bytearray) -> int:
@@ -1335,7 +1338,7 @@ class Client:
         type_ = snap7.types.wordlen_to_ctypes[WordLen.Byte.value]
         cdata = (type_ * size).from_buffer_copy(data)
         result = self._library.Cli_EBWrite(self._pointer, start, size, byref(cdata))
-        check_error(result)
+        check_error_client(result, library=self._library)
         return result
 
     def error_text(self, error: int) -> str:
@@ -1351,7 +1354,7 @@ class Client:
         error_code = c_int32(error)
         text = create_string_buffer(buffer_size)
         response = self._library.Cli_ErrorText(error_code, byref(text), text_length)
-        check_error(response)
+        check_error_client(response, library=self._library)
         result = bytearray(text)[:text_length.value].decode().strip('\x00')
         return result
 
@@ -1363,7 +1366,7 @@ class Client:
         """
         cp_info = S7CpInfo()
         result = self._library.Cli_GetCpInfo(self._pointer, byref(cp_info))
-        check_error(result)
+        check_error_client(result, library=self._library)
         return cp_info
 
     def get_exec_time(self) -> int:
@@ -1374,7 +1377,7 @@ class Client:
         """
         time = c_int32()
         result = self._library.Cli_GetExecTime(self._pointer, byref(time))
-        check_error(result)
+        check_error_client(result, library=self._library)
         return time.value
 
     def get_last_error(self) -> int:
@@ -1385,7 +1388,7 @@ class Client:
         """
         last_error = c_int32()
         result = self._library.Cli_GetLastError(self._pointer, byref(last_error))
-        check_error(result)
+        check_error_client(result, library=self._library)
         return last_error.value
 
     def get_order_code(self) -> S7OrderCode:
@@ -1396,7 +1399,7 @@ class Client:
         """
         order_code = S7OrderCode()
         result = self._library.Cli_GetOrderCode(self._pointer, byref(order_code))
-        check_error(result)
+        check_error_client(result, library=self._library)
         return order_code
 
     def get_pg_block_info(self, block: bytearray) -> TS7BlockInfo:
@@ -1412,7 +1415,7 @@ class Client:
         size = c_int(len(block))
         buffer = (c_byte * len(block)).from_buffer_copy(block)
         result = self._library.Cli_GetPgBlockInfo(self._pointer, byref(buffer), byref(block_info), size)
-        check_error(result)
+        check_error_client(result, library=self._library)
         return block_info
 
     def get_protection(self) -> S7Protection:
@@ -1423,7 +1426,7 @@ class Client:
         """
         s7_protection = S7Protection()
         result = self._library.Cli_GetProtection(self._pointer, byref(s7_protection))
-        check_error(result)
+        check_error_client(result, library=self._library)
         return s7_protection
 
     def iso_exchange_buffer(self, data: bytearray) -> bytearray:
@@ -1438,7 +1441,7 @@ class Client:
         size = c_int(len(data))
         cdata = (c_byte * len(data)).from_buffer_copy(data)
         response = self._library.Cli_IsoExchangeBuffer(self._pointer, byref(cdata), byref(size))
-        check_error(response)
+        check_error_client(response, library=self._library)
         result = bytearray(cdata)[:size.value]
         return result
 
@@ -1455,7 +1458,7 @@ class Client:
         type_ = snap7.types.wordlen_to_ctypes[WordLen.Byte.value]
         data = (type_ * size)()
         result = self._library.Cli_MBRead(self._pointer, start, size, byref(data))
-        check_error(result, context="client")
+        check_error_client(result, library=self._library)
         return bytearray(data)
 
     def mb_write(self, start: int, size: int, data: bytearray) -> int:
@@ -1472,7 +1475,7 @@ class Client:
         type_ = snap7.types.wordlen_to_ctypes[WordLen.Byte.value]
         cdata = (type_ * size).from_buffer_copy(data)
         result = self._library.Cli_MBWrite(self._pointer, start, size, byref(cdata))
-        check_error(result)
+        check_error_client(result, library=self._library)
         return result
 
     def read_szl(self, ssl_id: int, index: int = 0x0000) -> S7SZL:
@@ -1488,7 +1491,7 @@ class Client:
         s7_szl = S7SZL()
         size = c_int(sizeof(s7_szl))
         result = self._library.Cli_ReadSZL(self._pointer, ssl_id, index, byref(s7_szl), byref(size))
-        check_error(result, context="client")
+        check_error_client(result, library=self._library)
         return s7_szl
 
     def read_szl_list(self) -> bytearray:
@@ -1500,7 +1503,7 @@ class Client:
         szl_list = S7SZLList()
         items_count = c_int(sizeof(szl_list))
         response = self._library.Cli_ReadSZLList(self._pointer, byref(szl_list), byref(items_count))
-        check_error(response, context="client")
+        check_error_client(response, library=self._library)
         result = bytearray(szl_list.List)[:items_count.value]
         return result
 
@@ -1511,7 +1514,7 @@ class Client:
             Snap7 code.
         """
         result = self._library.Cli_SetPlcSystemDateTime(self._pointer)
-        check_error(result)
+        check_error_client(result, library=self._library)
         return result
 
     def tm_read(self, start: int, amount: int) -> bytearray:
@@ -1528,7 +1531,7 @@ class Client:
         type_ = snap7.types.wordlen_to_ctypes[wordlen.value]
         data = (type_ * amount)()
         result = self._library.Cli_TMRead(self._pointer, start, amount, byref(data))
-        check_error(result, context="client")
+        check_error_client(result, library=self._library)
         return bytearray(data)
 
     def tm_write(self, start: int, amount: int, data: bytearray) -> int:
@@ -1546,7 +1549,7 @@ class Client:
         type_ = snap7.types.wordlen_to_ctypes[wordlen.value]
         cdata = (type_ * amount).from_buffer_copy(data)
         result = self._library.Cli_TMWrite(self._pointer, start, amount, byref(cdata))
-        check_error(result)
+        check_error_client(result, library=self._library)
         return result
 
     def write_multi_vars(self, items: List[S7DataItem]) -> int:
@@ -1564,5 +1567,5 @@ class Client:
             data += bytearray(item)
         cdata = (S7DataItem * len(items)).from_buffer_copy(data)
         result = self._library.Cli_WriteMultiVars(self._pointer, byref(cdata), items_count)
-        check_error(result, context="client")
+        check_error_client(result, library=self._library)
         return result
@@ -1,30 +1,92 @@
 import os
 import sys
+import stat
 import logging
 import pathlib
-import platform
-from ctypes import c_char
+import functools
+import threading
+from ctypes import CDLL, POINTER, c_char, c_int32
 from ctypes.util import find_library
-from typing import Optional
+from typing import Callable, Dict, Optional
 
 from snap7.exceptions import Snap7Exception
 
-if platform.system() == 'Windows':
+if sys.platform == 'win32':
     from ctypes import windll as cdll  # type: ignore
 else:
     from ctypes import cdll
 
 logger = logging.getLogger(__name__)
 
-# regexp for checking if an ipv4 address is valid.
-ipv4 = r"^(([0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5])\.){3}([0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5])$"
+# The loaded snap7 CDLL and its error-text entry points, bound once by
+# load_library() so that hot paths skip the singleton lookup entirely.
+_LIB: Optional[CDLL] = None
+_ERROR_TEXT_FUNCS: Dict[str, Callable] = {}
+_ERROR_TEXT_NAMES = {
+    "client": "Cli_ErrorText",
+    "server": "Srv_ErrorText",
+    "partner": "Par_ErrorText",
+}
+
+# find_library('snap7') can shell out to ldconfig or gcc on POSIX, which is
+# far too expensive to repeat; the result never changes within a process.
+_cached_find_library = functools.lru_cache(maxsize=None)(find_library)
+
+# Per-thread scratch buffer for error_text(), so each lookup does not
+# allocate a fresh 1KB ctypes array.
+_tls = threading.local()
+
+
+try:
+    # compiled twin, only present when built with BUILD_CYTHON_EXTENSION
+    from snap7._common_fast import is_valid_ipv4
+except ImportError:
+    def is_valid_ipv4(address: str) -> bool:
+        """Checks if an ipv4 address is valid.
+
+        Replaces the old ipv4 regexp, which backtracked through the octet
+        alternations on every call; each octet is now a handful of integer
+        operations instead.
+
+        Args:
+            address: dotted-quad address to check, e.g. `"192.168.0.1"`.
+
+        Returns:
+            True if `address` is a valid ipv4 address, False otherwise.
+        """
+        try:
+            parts = address.encode("ascii").split(b".")
+        except UnicodeError:
+            return False
+        if len(parts) != 4:
+            return False
+        for part in parts:
+            if not part.isdigit() or len(part) > 3:
+                return False
+            if part[0] == 0x30 and len(part) > 1:  # no leading zeros
+                return False
+            digits = part.rjust(3, b"0")
+            value = (digits[0] - 48) * 100 + (digits[1] - 48) * 10 + (digits[2] - 48)
+            if value > 255:
+                return False
+        return True
 
 
 class ADict(dict):
     """
     Accessing dict keys like an attribute.
     """
-    __getattr__ = dict.__getitem__
+    # no instance __dict__ on top of the dict storage itself
+    __slots__ = ()
+
+    def __getattr__(self, name):
+        try:
+            return self[name]
+        except KeyError:
+            # a missing key must surface as AttributeError, otherwise
+            # hasattr() and getattr() with a default are broken
+            raise AttributeError(name) from None
+
     __setattr__ = dict.__setitem__  # type: ignore
 
 
@@ -35,36 +97,34 @@ class Snap7Library:
     Attributes:
         lib_location: full path to the `snap7.dll` file. Optional.
     """
-    _instance = None
+    _instance: Optional["Snap7Library"] = None
     lib_location: Optional[str]
+    cdll: CDLL
 
-    def __new__(cls, *args, **kwargs):
-        if not cls._instance:
-            cls._instance = object.__new__(cls)
-            cls._instance.lib_location = None
-            cls._instance.cdll = None
-        return cls._instance
-
-    def __init__(self, lib_location: Optional[str] = None):
-        """ Loads the snap7 library using ctypes cdll.
+    @classmethod
+    def get_instance(cls, lib_location: Optional[str] = None) -> "Snap7Library":
+        """Returns the singleton, loading the snap7 library using ctypes
+            cdll on first use.
 
         Args:
             lib_location: full path to the `snap7.dll` file. Optional.
 
         Raises:
-            Snap7Exception: if `lib_location` is not found.
+            Snap7Exception: if the library is not found.
         """
-        if self.cdll:  # type: ignore
-            return
-        self.lib_location = (lib_location
-                             or self.lib_location
-                             or find_in_package()
-                             or find_library('snap7')
-                             or find_locally('snap7'))
-        if not self.lib_location:
+        if cls._instance is not None:
+            return cls._instance
+        instance = object.__new__(cls)
+        instance.lib_location = (lib_location
+                                 or find_in_package()
+                                 or _cached_find_library('snap7')
+                                 or find_locally('snap7'))
+        if not instance.lib_location:
             msg = "can't find snap7 library. If installed, try running ldconfig"
             raise Snap7Exception(msg)
-        self.cdll = cdll.LoadLibrary(self.lib_location)
+        instance.cdll = cdll.LoadLibrary(instance.lib_location)
+        cls._instance = instance
+        return instance
 
 
 def load_library(lib_location: Optional[str] = None):
@@ -72,53 +132,136 @@ def load_library(lib_location: Optional[str] = None):
     Returns:
         cdll: a ctypes cdll object with the snap7 shared library loaded.
     """
-    return Snap7Library(lib_location).cdll
+    global _LIB
+    instance = Snap7Library.get_instance(lib_location)
+    lib = instance.cdll
+    if lib is not _LIB:
+        _LIB = lib
+        # Resolve the error-text entry points once, so the hot error path
+        # does not pay a ctypes attribute lookup on every call. Indexing
+        # the CDLL returns fresh, private function objects, so declaring
+        # prototypes here never touches the lib.Cli_ErrorText attribute
+        # other callers use with their own argument conventions.
+        for context, name in _ERROR_TEXT_NAMES.items():
+            func = lib[name]
+            # Declaring the prototypes once lets ctypes skip its per-call
+            # argument inference and reuse the prepared libffi call frame.
+            func.argtypes = [c_int32, POINTER(c_char), c_int32]
+            func.restype = c_int32
+            _ERROR_TEXT_FUNCS[context] = func
+        # get_instance() raised unless it found the library, so the
+        # location is always set here; the check narrows it for mypy.
+        lib_location = instance.lib_location
+        if lib_location is not None and sys.implementation.name == "pypy":
+            # on PyPy, cffi calls JIT well and generate much less GC
+            # pressure than ctypes; prefer them when cffi is available.
+            try:
+                from snap7 import _cffi_backend
+                _ERROR_TEXT_FUNCS.update(_cffi_backend.error_text_funcs(lib_location))
+            except ImportError:
+                pass
+    return lib
 
 
-def check_error(code: int, context: str = "client") -> None:
+def check_error(code: int, context: str = "client", library: Optional[CDLL] = None) -> None:
     """Check if the error code is set. If so, a Python log message is generated
         and an error is raised.
 
     Args:
         code: error code number.
         context: context in which is called.
+        library: snap7 CDLL already held by the caller. Optional; skips
+            the singleton lookup when given.
 
     Raises:
         Snap7Exception: if the code exists and is diferent from 1.
     """
-    if code and code != 1:
-        error = error_text(code, context)
-        logger.error(error)
-        raise Snap7Exception(error)
+    if 0 <= code <= 1:
+        # fast path: 0 (ok) and 1 (warning) are not errors; the chained
+        # compare avoids the separate truthiness test on code
+        return
+    error = error_text(code, context, library)
+    logger.error(error)
+    raise Snap7Exception(error)
 
 
-def error_text(error, context: str = "client") -> bytes:
+def error_text(error, context: str = "client", library: Optional[CDLL] = None) -> str:
     """Returns a textual explanation of a given error number
 
     Args:
         error: an error integer
         context: context in which is called from, server, client or partner
+        library: snap7 CDLL already held by the caller. Optional; skips
+            the singleton lookup when given.
 
     Returns:
-        The error.
+        The error, as a decoded string.
 
     Raises:
         TypeError: if the context is not in `["client", "server", "partner"]`
     """
-    if context not in ("client", "server", "partner"):
-        raise TypeError(f"Unkown context {context} used, should be either client, server or partner")
-    logger.debug(f"error text for {hex(error)}")
-    len_ = 1024
-    text_type = c_char * len_
-    text = text_type()
-    library = load_library()
-    if context == "client":
-        library.Cli_ErrorText(error, text, len_)
-    elif context == "server":
-        library.Srv_ErrorText(error, text, len_)
-    elif context == "partner":
-        library.Par_ErrorText(error, text, len_)
-    return text.value
+    # ctypes ints were accepted here before the cache was added; unbox
+    # them so the lru_cache key stays hashable
+    error = getattr(error, "value", error)
+    if library is None or library is _LIB:
+        # snap7 error codes are a closed set, so repeated lookups come
+        # straight out of the cache without touching the C library.
+        return _error_text_cached(error, context)
+    return _call_error_text(error, context, library)
+
+
+@functools.lru_cache(maxsize=512)
+def _error_text_cached(error: int, context: str) -> str:
+    if not _ERROR_TEXT_FUNCS:
+        load_library()
+    return _call_error_text(error, context, None)
+
+
+def _call_error_text(error: int, context: str, library: Optional[CDLL]) -> str:
+    # deferred %-formatting plus the isEnabledFor short-circuit: neither
+    # the message string nor the logger frame exist unless DEBUG is on
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("error text for %#x", error)
+    text = getattr(_tls, "error_buffer", None)
+    if text is None:
+        text = _tls.error_buffer = (c_char * 1024)()
+    try:
+        if library is not None:
+            # CDLL caches resolved functions as instance attributes, so
+            # this getattr is a plain dict lookup after the first call.
+            func = getattr(library, _ERROR_TEXT_NAMES[context])
+        else:
+            func = _ERROR_TEXT_FUNCS[context]
+    except KeyError:
+        raise TypeError(f"Unkown context {context} used, should be either client, server or partner") from None
+    func(error, text, 1024)
+    # .value stops at the NUL terminator snap7 always writes, so stale
+    # bytes from a previous, longer message are never returned.
+    return text.value.decode('latin-1')
+
+
+def _make_checker(context: str) -> Callable:
+    """Builds a check_error variant with `context` baked in, so hot call
+    sites neither pass the context string nor dispatch on it."""
+    _error_text = error_text
+    _log = logger.error
+
+    def check(code: int, library: Optional[CDLL] = None) -> None:
+        if 0 <= code <= 1:
+            return
+        error = _error_text(code, context, library)
+        _log(error)
+        raise Snap7Exception(error)
+
+    check.__name__ = f"check_error_{context}"
+    check.__qualname__ = check.__name__
+    check.__doc__ = f"check_error() specialized for the {context} context."
+    return check
+
+
+check_error_client = _make_checker("client")
+check_error_server = _make_checker("server")
+check_error_partner = _make_checker("partner")
 
 
 def find_locally(fname: str = "snap7") -> Optional[str]:
@@ -130,12 +273,18 @@ def find_locally(fname: str = "snap7") -> Optional[str]:
     Returns:
         Full path to the `snap7.dll` file.
     """
-    file = pathlib.Path.cwd() / f"{fname}.dll"
-    if file.exists():
-        return str(file)
-    return None
+    # the working directory is part of the cache key, so a chdir between
+    # calls does not serve a stale result.
+    return _find_locally(fname, os.getcwd())
+
+
+@functools.lru_cache(maxsize=None)
+def _find_locally(fname: str, cwd: str) -> Optional[str]:
+    path = os.path.join(cwd, fname + ".dll")
+    return path if os.path.isfile(path) else None
 
 
+@functools.lru_cache(maxsize=None)
 def find_in_package() -> Optional[str]:
     """Find the `snap7.dll` file according to the os used.
 
@@ -149,7 +298,10 @@ def find_in_package() -> Optional[str]:
         lib = 'snap7.dll'
     else:
         lib = 'libsnap7.so'
-    full_path = basedir.joinpath('lib', lib)
-    if os.path.exists(full_path) and os.path.isfile(full_path):
-        return str(full_path)
-    return None
+    full_path = os.path.join(str(basedir), 'lib', lib)
+    # a single stat() answers both "exists" and "is a regular file"
+    try:
+        st = os.stat(full_path)
+    except OSError:
+        return None
+    return full_path if stat.S_ISREG(st.st_mode) else None
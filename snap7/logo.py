@@ -9,7 +9,7 @@ from ctypes import c_void_p
 
 import snap7
 from snap7 import types
-from snap7.common import check_error, load_library, ipv4
+from snap7.common import check_error_client, load_library, is_valid_ipv4
 from snap7.exceptions import Snap7Exception
 from snap7.types import S7Object, WordLen
 from snap7.types import param_types
@@ -63,7 +63,7 @@ class Logo:
         """
         logger.info("disconnecting snap7 client")
         result = self.library.Cli_Disconnect(self.pointer)
-        check_error(result, context="client")
+        check_error_client(result, library=self.library)
         return result
 
     def connect(self, ip_address: str, tsap_snap7: int, tsap_logo: int, tcpport: int = 102) -> int:
@@ -87,7 +87,7 @@ class Logo:
         self.set_param(snap7.types.RemotePort, tcpport)
         self.set_connection_params(ip_address, tsap_snap7, tsap_logo)
         result = self.library.Cli_Connect(self.pointer)
-        check_error(result, context="client")
+        check_error_client(result, library=self.library)
         return result
 
     def read(self, vm_address: str):
@@ -140,7 +140,7 @@ class Logo:
 
         result = self.library.Cli_ReadArea(self.pointer, area.value, db_number, start,
                                            size, wordlen.value, byref(data))
-        check_error(result, context="client")
+        check_error_client(result, library=self.library)
         # transform result to int value
         if wordlen == WordLen.Bit:
             return data[0]
@@ -213,7 +213,7 @@ class Logo:
         logger.debug(f"write, vm_address:{vm_address} value:{value}")
 
         result = self.library.Cli_WriteArea(self.pointer, area.value, db_number, start, amount, wordlen.value, byref(cdata))
-        check_error(result, context="client")
+        check_error_client(result, library=self.library)
         return result
 
     def db_read(self, db_number: int, start: int, size: int) -> bytearray:
@@ -234,7 +234,7 @@ class Logo:
         result = (self.library.Cli_DBRead(
             self.pointer, db_number, start, size,
             byref(data)))
-        check_error(result, context="client")
+        check_error_client(result, library=self.library)
         return bytearray(data)
 
     def db_write(self, db_number: int, start: int, data: bytearray) -> int:
@@ -254,7 +254,7 @@ class Logo:
         cdata = (type_ * size).from_buffer_copy(data)
         logger.debug(f"db_write db_number:{db_number} start:{start} size:{size} data:{data}")
         result = self.library.Cli_DBWrite(self.pointer, db_number, start, size, byref(cdata))
-        check_error(result, context="client")
+        check_error_client(result, library=self.library)
         return result
 
     def set_connection_params(self, ip_address: str, tsap_snap7: int, tsap_logo: int):
@@ -272,7 +272,7 @@ class Logo:
             :obj:`ValueError`: if the `ip_address` is not an IPV4.
             :obj:`Snap7Exception`: if the snap7 error code is diferent from 0.
         """
-        if not re.match(ipv4, ip_address):
+        if not is_valid_ipv4(ip_address):
             raise ValueError(f"{ip_address} is invalid ipv4")
         result = self.library.Cli_SetConnectionParams(self.pointer, ip_address.encode(),
                                                       c_uint16(tsap_snap7),
@@ -307,7 +307,7 @@ class Logo:
         """
         connected = c_int32()
         result = self.library.Cli_GetConnected(self.pointer, byref(connected))
-        check_error(result, context="client")
+        check_error_client(result, library=self.library)
         return bool(connected)
 
     def set_param(self, number: int, value):
@@ -323,7 +323,7 @@ class Logo:
         logger.debug(f"setting param number {number} to {value}")
         type_ = param_types[number]
         result = self.library.Cli_SetParam(self.pointer, number, byref(type_(value)))
-        check_error(result, context="client")
+        check_error_client(result, library=self.library)
         return result
 
     def get_param(self, number) -> int:
@@ -340,5 +340,5 @@ class Logo:
         value = type_()
         code = self.library.Cli_GetParam(self.pointer, c_int(number),
                                          byref(value))
-        check_error(code)
+        check_error_client(code, library=self.library)
         return value.value
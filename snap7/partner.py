@@ -9,11 +9,10 @@ is requesting the connection.
 """
 from ctypes import c_int32, c_uint32, byref, c_uint16, c_int, c_void_p
 import logging
-import re
 from typing import Tuple, Optional
 
 import snap7.types
-from snap7.common import load_library, check_error, ipv4
+from snap7.common import load_library, check_error_partner, is_valid_ipv4
 from snap7.exceptions import Snap7Exception
 
 logger = logging.getLogger(__name__)
@@ -22,9 +21,12 @@ logger = logging.getLogger(__name__)
 def error_wrap(func):
     """Parses a s7 error code returned the decorated function."""
 
-    def f(*args, **kw):
-        code = func(*args, **kw)
-        check_error(code, context="partner")
+    # see snap7.client.error_wrap: argument-default binding plus an
+    # inlined fast path keeps the non-error case free of extra lookups.
+    def f(*args, _func=func, _check=check_error_partner, **kw):
+        code = _func(*args, **kw)
+        if code < 0 or code > 1:
+            _check(code, args[0]._library)
 
     return f
 
@@ -117,7 +119,7 @@ class Partner:
         """
         error = c_int32()
         result = self._library.Par_GetLastError(self._pointer, byref(error))
-        check_error(result, "partner")
+        check_error_partner(result, library=self._library)
         return error
 
     def get_param(self, number) -> int:
@@ -129,7 +131,7 @@ class Partner:
         value = type_()
         code = self._library.Par_GetParam(self._pointer, c_int(number),
                                           byref(value))
-        check_error(code)
+        check_error_partner(code, library=self._library)
         return value.value
 
     def get_stats(self) -> Tuple[c_uint32, c_uint32, c_uint32, c_uint32]:
@@ -146,7 +148,7 @@ class Partner:
                                             byref(recv),
                                             byref(send_errors),
                                             byref(recv_errors))
-        check_error(result, "partner")
+        check_error_partner(result, library=self._library)
         return sent, recv, send_errors, recv_errors
 
     def get_status(self) -> c_int32:
@@ -155,7 +157,7 @@ class Partner:
         """
         status = c_int32()
         result = self._library.Par_GetStatus(self._pointer, byref(status))
-        check_error(result, "partner")
+        check_error_partner(result, library=self._library)
         return status
 
     def get_times(self) -> Tuple[c_int32, c_int32]:
@@ -165,7 +167,7 @@ class Partner:
         send_time = c_int32()
         recv_time = c_int32()
         result = self._library.Par_GetTimes(self._pointer, byref(send_time), byref(recv_time))
-        check_error(result, "partner")
+        check_error_partner(result, library=self._library)
         return send_time, recv_time
 
     @error_wrap
@@ -210,9 +212,9 @@ class Partner:
         :param remote_tsap: PLC TSAP
         """
 
-        if not re.match(ipv4, local_ip):
+        if not is_valid_ipv4(local_ip):
             raise ValueError(f"{local_ip} is invalid ipv4")
-        if not re.match(ipv4, remote_ip):
+        if not is_valid_ipv4(remote_ip):
             raise ValueError(f"{remote_ip} is invalid ipv4")
         logger.info(f"starting partnering from {local_ip} to {remote_ip}")
         return self._library.Par_StartTo(self._pointer, local_ip, remote_ip,
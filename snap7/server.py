@@ -2,7 +2,6 @@
 Snap7 server used for mimicking a siemens 7 server.
 """
 import logging
-import re
 import struct
 import time
 import ctypes
@@ -10,16 +9,19 @@ from typing import Tuple, Optional, Callable, Any
 
 import snap7
 import snap7.types
-from snap7.common import check_error, load_library, ipv4
+from snap7.common import check_error_server, load_library, is_valid_ipv4
 
 logger = logging.getLogger(__name__)
 
 
 def error_wrap(func):
     """Parses a s7 error code returned the decorated function."""
-    def f(*args, **kw):
-        code = func(*args, **kw)
-        check_error(code, context="server")
+    # see snap7.client.error_wrap: argument-default binding plus an
+    # inlined fast path keeps the non-error case free of extra lookups.
+    def f(*args, _func=func, _check=check_error_server, **kw):
+        code = _func(*args, **kw)
+        if code < 0 or code > 1:
+            _check(code, args[0].library)
 
     return f
 
@@ -62,7 +64,7 @@ class Server:
         text = text_type()
         error = self.library.Srv_EventText(ctypes.byref(event),
                                            ctypes.byref(text), len_)
-        check_error(error)
+        check_error_server(error, library=self.library)
         return text.value.decode('ascii')
 
     def create(self):
@@ -196,7 +198,7 @@ class Server:
         error = self.library.Srv_GetStatus(self.pointer, ctypes.byref(server_status),
                                            ctypes.byref(cpu_status),
                                            ctypes.byref(clients_count))
-        check_error(error)
+        check_error_server(error, library=self.library)
         logger.debug(f"status server {server_status.value} cpu {cpu_status.value} clients {clients_count.value}")
         return (
             snap7.types.server_statuses[server_status.value],
@@ -262,7 +264,7 @@ class Server:
         if tcpport != 102:
             logger.info(f"setting server TCP port to {tcpport}")
             self.set_param(snap7.types.LocalPort, tcpport)
-        if not re.match(ipv4, ip):
+        if not is_valid_ipv4(ip):
             raise ValueError(f"{ip} is invalid ipv4")
         logger.info(f"starting server to {ip}:102")
         return self.library.Srv_StartTo(self.pointer, ip)
@@ -325,7 +327,7 @@ class Server:
         ready = ctypes.c_int32()
         code = self.library.Srv_PickEvent(self.pointer, ctypes.byref(event),
                                           ctypes.byref(ready))
-        check_error(code)
+        check_error_server(code, library=self.library)
         if ready:
             logger.debug(f"one event ready: {event}")
             return event
@@ -345,7 +347,7 @@ class Server:
         value = ctypes.c_int()
         code = self.library.Srv_GetParam(self.pointer, number,
                                          ctypes.byref(value))
-        check_error(code)
+        check_error_server(code, library=self.library)
         return value.value
 
     def get_mask(self, kind: int) -> ctypes.c_uint32:
@@ -360,7 +362,7 @@ class Server:
         logger.debug(f"retrieving mask kind {kind}")
         mask = snap7.types.longword()
         code = self.library.Srv_GetMask(self.pointer, kind, ctypes.byref(mask))
-        check_error(code)
+        check_error_server(code, library=self.library)
         return mask
 
     @error_wrap
@@ -597,7 +597,7 @@ class TestClient(unittest.TestCase):
                 res2 = self.client.wait_as_completion(timeout)
                 check_error(res2)
             except Snap7Exception as s7_err:
-                if not s7_err.args[0] == b'CLI : Job Timeout':
+                if not s7_err.args[0] == 'CLI : Job Timeout':
                     self.fail(f"While waiting another error appeared: {s7_err}")
                 return
             except BaseException:
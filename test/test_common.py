@@ -2,7 +2,7 @@ import logging
 import unittest
 import pathlib
 
-from snap7.common import find_locally
+from snap7.common import find_locally, is_valid_ipv4
 
 
 logging.basicConfig(level=logging.WARNING)
@@ -32,6 +32,13 @@ class TestCommon(unittest.TestCase):
         file = find_locally(file_name_test.replace(".dll", ""))
         self.assertEqual(file, str(self.BASE_DIR / file_name_test))
 
+    def test_is_valid_ipv4(self):
+        for address in ("0.0.0.0", "1.2.3.4", "192.168.0.1", "255.255.255.255"):
+            self.assertTrue(is_valid_ipv4(address))
+        for address in ("", "1.2.3", "1.2.3.4.5", "256.1.1.1", "01.2.3.4",
+                        "1.2.3.4 ", "a.b.c.d", "1..2.3", "1.2.3.④"):
+            self.assertFalse(is_valid_ipv4(address))
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file